@@ -1,14 +1,193 @@
 import streamlit as st
 import pandas as pd
-from typing import List, Dict
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+from typing import List, Dict, Tuple, Optional
+from collections import defaultdict
 import os
-import random
+import tempfile
+
+# Columns the app reads from the demo CSV
+DEMO_COLUMNS = [
+    'source_name', 'source_title', 'source_company', 'source_location',
+    'similar_name', 'similar_title', 'similar_company', 'similar_location',
+    'similarity_score'
+]
+
+# Columns concatenated into the lowercase text that keyword search runs against
+SEARCH_COLUMNS = ['source_name', 'source_title', 'source_company', 'similar_name', 'similar_title', 'similar_company']
+
+# Similar-professional columns and the keys they are returned under
+SIMILAR_PROFILE_COLUMNS = {
+    'similar_name': 'name',
+    'similar_title': 'title',
+    'similar_company': 'company',
+    'similar_location': 'location'
+}
+
+# Canned queries offered under "Try These Demo Searches" (a tuple so button order and keys stay fixed)
+DEMO_SEARCHES = (
+    "software engineer google",
+    "product manager",
+    "goldman sachs",
+    "director amazon",
+    "data scientist"
+)
+
+# Result counts offered on the search tab; every count is a prefix of the largest one
+RESULT_COUNT_OPTIONS = [10, 15, 20]
+
+# Repetitive profile attributes stored as categoricals (small int codes instead of one string per row)
+CATEGORY_COLUMNS = [
+    'source_name', 'source_title', 'source_company', 'source_location',
+    'similar_title', 'similar_company', 'similar_location'
+]
+
+# Parquet metadata key recording which CSV (size and mtime) a Parquet copy was written from
+PARQUET_SOURCE_KEY = b'source_csv_signature'
+
+def get_file_signature(path: str) -> bytes:
+    """Exact size and modification time of a file, used to match a Parquet copy to its CSV"""
+    stat = os.stat(path)
+    return f"{stat.st_size}:{stat.st_mtime_ns}".encode()
+
+def read_parquet_copy(parquet_file: str, csv_signature: bytes) -> Optional[pd.DataFrame]:
+    """Read the Parquet copy if it was written from the current CSV (None if missing, stale or unreadable)"""
+    if not os.path.exists(parquet_file):
+        return None
+    
+    try:
+        metadata = pq.read_schema(parquet_file).metadata or {}
+        if metadata.get(PARQUET_SOURCE_KEY) != csv_signature:
+            return None
+        return pq.read_table(parquet_file, columns=DEMO_COLUMNS).to_pandas()
+    except Exception:
+        # A truncated or corrupt copy is just a cache miss; the CSV is the source of truth
+        return None
+
+def write_parquet_copy(df: pd.DataFrame, parquet_file: str, csv_signature: bytes):
+    """Atomically write the Parquet copy for the next cold start (best effort, never fails the load)"""
+    temp_file = None
+    try:
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        table = table.replace_schema_metadata({**(table.schema.metadata or {}), PARQUET_SOURCE_KEY: csv_signature})
+        
+        # Write next to the target and rename into place so readers never see a partial file
+        fd, temp_file = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(parquet_file)), suffix='.parquet.tmp')
+        os.close(fd)
+        pq.write_table(table, temp_file, compression='zstd')
+        os.replace(temp_file, parquet_file)
+    except Exception:
+        # Read-only app directory, full disk, etc.: skip the copy and keep serving from the CSV
+        if temp_file and os.path.exists(temp_file):
+            try:
+                os.remove(temp_file)
+            except OSError:
+                pass
+
+# Large read-only structures use st.cache_resource (shared by reference, no pickling per access);
+# st.cache_data is kept for small value results such as stats and search hits
+@st.cache_resource(show_spinner=False)
+def load_demo_data(csv_file: str) -> pd.DataFrame:
+    """Read the demo CSV and precompute the lowercase search text (one shared read-only frame)"""
+    # Prefer the columnar Parquet copy next to the CSV, but only if it was written from this exact CSV
+    parquet_file = os.path.splitext(csv_file)[0] + '.parquet'
+    csv_signature = get_file_signature(csv_file)
+    df = read_parquet_copy(parquet_file, csv_signature)
+    if df is None:
+        df = pd.read_csv(csv_file, engine='pyarrow', usecols=DEMO_COLUMNS, dtype={'similarity_score': 'float32'})
+        write_parquet_copy(df, parquet_file, csv_signature)
+    
+    # Categories in order of first appearance so value_counts ties keep dataset order
+    for col in CATEGORY_COLUMNS:
+        df[col] = pd.Categorical(df[col], categories=df[col].dropna().unique())
+    
+    # Build the searchable text once instead of per row on every query, joining and
+    # lowercasing whole columns with Arrow's vectorized string kernels
+    text_columns = [pc.cast(pa.array(df[col], from_pandas=True), pa.string()) for col in SEARCH_COLUMNS]
+    search_text = pc.binary_join_element_wise(*text_columns, ' ', null_handling='replace')
+    df['search_text'] = pc.utf8_lower(search_text).to_pandas()
+    
+    # Integer id per similar professional, so result de-duplication hashes ints instead of names
+    df['similar_id'] = pd.factorize(df['similar_name'], use_na_sentinel=False)[0].astype(np.int32)
+    
+    # Record which version of the file this frame was read from, so staleness is judged
+    # against the data actually served rather than whatever is on disk when an instance is built
+    df.attrs['source_signature'] = csv_signature
+    
+    return df
+
+@st.cache_resource(show_spinner=False)
+def build_search_index(csv_file: str) -> Tuple[pa.Array, List[np.ndarray]]:
+    """Index the search text: every distinct whitespace token and the row positions containing it"""
+    postings = defaultdict(list)
+    for row, text in enumerate(load_demo_data(csv_file)['search_text']):
+        for token in set(text.split()):
+            postings[token].append(row)
+    
+    # Tokens as an Arrow array so queries can match them with vectorized substring kernels
+    return pa.array(list(postings), type=pa.string()), [np.array(rows, dtype=np.int32) for rows in postings.values()]
+
+@st.cache_resource(show_spinner=False)
+def build_source_index(csv_file: str) -> Dict[str, np.ndarray]:
+    """Map every source professional to the row positions of their similarity network"""
+    return load_demo_data(csv_file).groupby('source_name', observed=True, sort=False).indices
+
+@st.cache_resource(show_spinner=False)
+def build_source_profiles(csv_file: str) -> pd.DataFrame:
+    """Distinct source professionals with their network size, most connected first"""
+    profile_columns = ['source_name', 'source_title', 'source_company', 'source_location']
+    
+    # Only rows with a complete source profile count, as with a groupby over the four columns
+    complete = load_demo_data(csv_file).dropna(subset=profile_columns)
+    network_sizes = complete['source_name'].value_counts(sort=False)
+    
+    # One profile row per source professional instead of grouping every relationship row
+    profiles = complete.drop_duplicates('source_name')[profile_columns]
+    profiles = profiles.assign(network_size=profiles['source_name'].map(network_sizes).astype(np.int64))
+    
+    return profiles.sort_values('network_size', ascending=False, kind='stable').reset_index(drop=True)
+
+@st.cache_data(show_spinner=False)
+def compute_demo_stats(csv_file: str) -> Dict:
+    """Aggregate the demo dataset once instead of on every sidebar and insights render"""
+    df = load_demo_data(csv_file)
+    
+    return {
+        'total_relationships': len(df),
+        'unique_source_profiles': df['source_name'].nunique(),
+        'unique_similar_professionals': df['similar_name'].nunique(),
+        'average_similarity': df['similarity_score'].mean(),
+        'top_companies': df['source_company'].value_counts().head(10).index.tolist(),
+        'top_locations': df['source_location'].value_counts().head(8).index.tolist()
+    }
 
 class NuvelProfessionalSimilarityDemo:
     def __init__(self, csv_file='premium_western_demo.csv'):
         self.csv_file = csv_file
+        self.data_signature = self.get_data_signature()
         self.df = self.load_data()
         
+        # Lookup structures shared across reruns (empty when the data failed to load)
+        if self.df.empty:
+            self.search_tokens, self.search_postings = pa.array([], type=pa.string()), []
+            self.source_index = {}
+            self.source_profiles = pd.DataFrame()
+        else:
+            self.search_tokens, self.search_postings = build_search_index(csv_file)
+            self.source_index = build_source_index(csv_file)
+            self.source_profiles = build_source_profiles(csv_file)
+        
+    def get_data_signature(self) -> Optional[bytes]:
+        """Size and modification time of the demo data file on disk (None if it is missing)"""
+        return get_file_signature(self.csv_file) if os.path.exists(self.csv_file) else None
+    
+    def is_stale(self) -> bool:
+        """Whether the demo data file on disk differs from the version this instance is serving"""
+        return self.get_data_signature() != self.data_signature
+    
     def load_data(self) -> pd.DataFrame:
         """Load the premium professional similarity data"""
         try:
@@ -16,7 +195,10 @@ class NuvelProfessionalSimilarityDemo:
                 st.error(f"❌ Demo data file '{self.csv_file}' not found.")
                 return pd.DataFrame()
             
-            df = pd.read_csv(self.csv_file)
+            df = load_demo_data(self.csv_file)
+            
+            # The frame may come from cache, so take the signature of the file it was read from
+            self.data_signature = df.attrs.get('source_signature', self.data_signature)
             if df.empty:
                 st.error("❌ Demo dataset is empty")
                 return pd.DataFrame()
@@ -31,14 +213,7 @@ class NuvelProfessionalSimilarityDemo:
         if self.df.empty:
             return {}
         
-        return {
-            'total_relationships': len(self.df),
-            'unique_source_profiles': self.df['source_name'].nunique(),
-            'unique_similar_professionals': self.df['similar_name'].nunique(),
-            'average_similarity': self.df['similarity_score'].mean(),
-            'top_companies': list(self.df['source_company'].value_counts().head(10).index),
-            'top_locations': list(self.df['source_location'].value_counts().head(8).index)
-        }
+        return compute_demo_stats(self.csv_file)
     
     def search_similar_professionals(self, query: str, max_results: int = 15) -> List[Dict]:
         """Search for professionals and return their similarity matches"""
@@ -51,84 +226,221 @@ class NuvelProfessionalSimilarityDemo:
         if not query_words:
             return []
         
-        matching_results = []
+        # Query words contain no whitespace, so a word occurs in a row's text exactly when it
+        # occurs inside one of the row's tokens: expand each word over the token vocabulary
+        # and collect the rows from the matching posting lists
+        word_rows = []
+        for word in query_words:
+            matching_tokens = np.flatnonzero(pc.match_substring(self.search_tokens, word).to_numpy(zero_copy_only=False))
+            if len(matching_tokens):
+                word_rows.append(np.unique(np.concatenate([self.search_postings[token] for token in matching_tokens])))
         
-        # Search through both source and similar profiles
-        for _, row in self.df.iterrows():
-            searchable_text = f"{row['source_name']} {row['source_title']} {row['source_company']} {row['similar_name']} {row['similar_title']} {row['similar_company']}".lower()
-            
-            # Count word matches for relevance scoring
-            match_score = sum(1 for word in query_words if word in searchable_text)
-            
-            if match_score > 0:
-                # Return the similar professional as the result
-                matching_results.append({
-                    'name': row['similar_name'],
-                    'title': row['similar_title'],
-                    'company': row['similar_company'],
-                    'location': row['similar_location'],
-                    'similarity_score': row['similarity_score'],
-                    'source_reference': f"Similar to {row['source_name']} ({row['source_title']} @ {row['source_company']})",
-                    'match_score': match_score
-                })
+        if not word_rows:
+            return []
+        
+        # Count word matches for relevance scoring across both source and similar profiles; candidates
+        # and counts come from the posting lists alone, so no array the size of the frame is touched
+        candidates, match_scores = np.unique(np.concatenate(word_rows), return_counts=True)
         
-        # Sort by match relevance, then by similarity score
-        matching_results.sort(key=lambda x: (-x['match_score'], -x['similarity_score']))
+        # Rank by match relevance, then by similarity score (a percentage, so it never outweighs
+        # an extra matched word); only the best-ranked candidates are fully sorted
+        similarity = self.df['similarity_score'].to_numpy()[candidates].astype(np.float64)
+        rank = match_scores * 1000.0 + similarity
+        top_rows = self._top_unique_rows(candidates, rank, max_results)
+        matches = self.df.iloc[top_rows].assign(match_score=match_scores[np.searchsorted(candidates, top_rows)])
         
-        # Remove duplicates by name
-        seen_names = set()
-        unique_results = []
-        for result in matching_results:
-            if result['name'] not in seen_names:
-                seen_names.add(result['name'])
-                unique_results.append(result)
+        # Return the similar professional as the result
+        results = matches.assign(
+            source_reference='Similar to ' + matches['source_name'].astype(str) + ' (' + matches['source_title'].astype(str) + ' @ ' + matches['source_company'].astype(str) + ')'
+        )[list(SIMILAR_PROFILE_COLUMNS) + ['similarity_score', 'source_reference', 'match_score']]
         
-        return unique_results[:max_results]
+        return results.rename(columns=SIMILAR_PROFILE_COLUMNS).to_dict('records')
+    
+    def _top_unique_rows(self, rows: np.ndarray, rank: np.ndarray, count: int) -> np.ndarray:
+        """Return up to `count` rows by descending rank, keeping the best row per similar professional"""
+        similar_ids = self.df['similar_id'].to_numpy()
+        limit = max(count, 1)
+        
+        while True:
+            if limit < len(rows):
+                # Keep every row tied with the limit-th best rank so the order matches a full sort
+                threshold = np.partition(rank, len(rank) - limit)[len(rank) - limit]
+                selected = np.flatnonzero(rank >= threshold)
+            else:
+                selected = np.arange(len(rows))
+            
+            # Descending rank, ties in dataset order
+            ranked_rows = rows[selected[np.lexsort((rows[selected], -rank[selected]))]]
+            unique_rows = ranked_rows[~pd.Index(similar_ids[ranked_rows]).duplicated()]
+            
+            # Duplicates can leave fewer than `count` names; widen the window and retry
+            if len(unique_rows) >= count or len(selected) == len(rows):
+                return unique_rows[:count]
+            limit *= 2
     
     def get_featured_professionals(self, count: int = 10) -> List[Dict]:
         """Get featured source professionals with their similarity network size"""
         if self.df.empty:
             return []
         
-        # Group by source profile to get network sizes
-        source_groups = self.df.groupby(['source_name', 'source_title', 'source_company', 'source_location']).size().reset_index(name='network_size')
-        
-        # Sort by network size to get most connected professionals
-        source_groups = source_groups.sort_values('network_size', ascending=False)
-        
-        featured = []
-        for _, profile in source_groups.head(count).iterrows():
-            featured.append({
-                'name': profile['source_name'],
-                'title': profile['source_title'],
-                'company': profile['source_company'],
-                'location': profile['source_location'],
-                'network_size': profile['network_size']
-            })
-        
-        return featured
+        # Source profiles are ranked by network size once at load, so this is just a slice
+        return self.source_profiles.head(count).rename(columns={
+            'source_name': 'name',
+            'source_title': 'title',
+            'source_company': 'company',
+            'source_location': 'location'
+        }).to_dict('records')
     
-    def find_similar_to_professional(self, source_name: str) -> List[Dict]:
-        """Find all professionals similar to a specific source professional"""
+    def find_similar_to_professional(self, source_name: str, max_results: Optional[int] = None) -> List[Dict]:
+        """Find professionals similar to a specific source professional (all of them unless max_results is given)"""
         if self.df.empty:
             return []
         
-        similar_profiles = self.df[self.df['source_name'] == source_name]
+        network_rows = self.source_index.get(source_name)
+        if network_rows is None:
+            return []
         
-        results = []
-        for _, row in similar_profiles.iterrows():
-            results.append({
-                'name': row['similar_name'],
-                'title': row['similar_title'],
-                'company': row['similar_company'],
-                'location': row['similar_location'],
-                'similarity_score': row['similarity_score']
-            })
+        # Sort by similarity score, selecting only the top rows when the caller needs just a few
+        network = self.df.iloc[network_rows]
+        if max_results is None:
+            similar_profiles = network.sort_values('similarity_score', ascending=False, kind='stable')
+        else:
+            similar_profiles = network.nlargest(max_results, 'similarity_score')
         
-        # Sort by similarity score
-        results.sort(key=lambda x: -x['similarity_score'])
+        return similar_profiles[list(SIMILAR_PROFILE_COLUMNS) + ['similarity_score']].rename(columns=SIMILAR_PROFILE_COLUMNS).to_dict('records')
+
+@st.cache_resource(show_spinner=False)
+def get_demo(csv_file: str = 'premium_western_demo.csv') -> NuvelProfessionalSimilarityDemo:
+    """Share one read-only demo instance across reruns and sessions"""
+    return NuvelProfessionalSimilarityDemo(csv_file)
+
+def normalize_query(query: str) -> str:
+    """Lowercase a query and collapse its whitespace so equivalent queries share a cache entry"""
+    return ' '.join(query.lower().split())
+
+@st.cache_data(ttl=3600, max_entries=256, show_spinner=False)
+def cached_similarity_search(csv_file: str, query: str, max_results: int) -> List[Dict]:
+    """Search once per (query, max_results) so repeated searches are served from cache"""
+    return get_demo(csv_file).search_similar_professionals(query, max_results)
+
+@st.cache_data(show_spinner=False)
+def precompute_demo_searches(csv_file: str) -> Dict[str, List[Dict]]:
+    """Run the canned demo searches once so their buttons only look up the top matches"""
+    return {search_term: cached_similarity_search(csv_file, search_term, 5) for search_term in DEMO_SEARCHES}
+
+@st.fragment
+def render_search_tab(demo: NuvelProfessionalSimilarityDemo):
+    """Search tab; runs as a fragment so its widgets rerun only this tab"""
+    st.header("🔍 Professional Similarity Search")
+    st.markdown("**Find professionals similar to your target candidates:**")
+    
+    # Only search on submit, not on every keystroke or unrelated widget rerun
+    with st.form("search_form"):
+        col1, col2 = st.columns([3, 1])
+        with col1:
+            search_query = st.text_input(
+                "Search for professionals:",
+                placeholder="software engineer google, product manager meta, director amazon",
+                help="Search by name, title, company, or location"
+            )
+        with col2:
+            max_results = st.selectbox("Results:", RESULT_COUNT_OPTIONS, index=1)
         
-        return results
+        submitted = st.form_submit_button("🔍 Find Similar Professionals", type="primary")
+    
+    # Keep showing the submitted search when other widgets rerun the app
+    if submitted:
+        st.session_state['submitted_query'] = search_query
+    search_query = st.session_state.get('submitted_query', '')
+    
+    if search_query:
+        with st.spinner("Analyzing professional similarity patterns..."):
+            # Fetch the largest page once per query; smaller counts are slices of it
+            results = cached_similarity_search(demo.csv_file, normalize_query(search_query), max(RESULT_COUNT_OPTIONS))[:max_results]
+        
+        if results:
+            st.success(f"✅ Found **{len(results)}** similar professionals matching '{search_query}'")
+            
+            for i, result in enumerate(results, 1):
+                with st.container():
+                    col1, col2 = st.columns([4, 1])
+                    
+                    with col1:
+                        # One markdown element per card instead of one per line
+                        st.markdown(
+                            f"### {i}. 👤 {result['name']}\n\n"
+                            f"**{result['title']}** at **{result['company']}**\n\n"
+                            f"📍 {result['location']}"
+                        )
+                        st.caption(result['source_reference'])
+                    
+                    with col2:
+                        st.metric("Similarity", f"{result['similarity_score']:.1f}%")
+                        if st.button("📧 Contact", key=f"contact_{i}", help="Full contact info in premium version"):
+                            st.info("Contact information available in full platform")
+                    
+                    st.divider()
+        
+        else:
+            st.warning("No similar professionals found for this search.")
+            st.info("💡 Try: 'software engineer', 'google', 'product manager', 'director'")
+    
+    # Quick demo searches
+    st.markdown("### 🚀 Try These Demo Searches")
+    demo_results = precompute_demo_searches(demo.csv_file)
+    
+    cols = st.columns(len(DEMO_SEARCHES))
+    for i, search_term in enumerate(DEMO_SEARCHES):
+        with cols[i]:
+            if st.button(f"🔍 {search_term.title()}", key=f"demo_{i}"):
+                results = demo_results[search_term]
+                if results:
+                    st.success(f"**{len(results)}** matches:")
+                    st.markdown("  \n".join(
+                        f"**{j}.** {r['name']} - *{r['title']}* @ **{r['company']}** ({r['similarity_score']:.1f}%)"
+                        for j, r in enumerate(results[:3], 1)
+                    ))
+
+@st.fragment
+def render_featured_tab(demo: NuvelProfessionalSimilarityDemo):
+    """Featured networks tab; runs as a fragment so View Network clicks rerun only this tab"""
+    st.header("⭐ Featured Professional Networks")
+    st.markdown("**Explore these professionals and their similarity networks:**")
+    
+    featured = demo.get_featured_professionals(8)
+    
+    if featured:
+        for i, professional in enumerate(featured, 1):
+            with st.container():
+                col1, col2, col3 = st.columns([3, 2, 1])
+                
+                with col1:
+                    st.markdown(f"### {i}. 👤 {professional['name']}")
+                    st.markdown(f"**{professional['title']}**")
+                    st.markdown(f"🏢 {professional['company']}")
+                    st.markdown(f"📍 {professional['location']}")
+                
+                with col2:
+                    st.metric("Similar Professionals", professional['network_size'])
+                    st.caption("In their similarity network")
+                
+                with col3:
+                    if st.button(f"👥 View Network", key=f"network_{i}", type="secondary"):
+                        similar_pros = demo.find_similar_to_professional(professional['name'], 6)
+                        
+                        if similar_pros:
+                            st.success(f"**{professional['network_size']}** professionals in {professional['name']}'s network:")
+                            
+                            for j, similar in enumerate(similar_pros, 1):
+                                with st.expander(f"#{j} {similar['name']} - {similar['company']}", expanded=True):
+                                    col_a, col_b = st.columns(2)
+                                    with col_a:
+                                        st.markdown(f"**{similar['title']}**")
+                                        st.markdown(f"📍 {similar['location']}")
+                                    with col_b:
+                                        st.metric("Similarity", f"{similar['similarity_score']:.1f}%")
+                
+                st.divider()
 
 def main():
     st.set_page_config(
@@ -142,9 +454,19 @@ def main():
     st.markdown("**Discover professionals similar to your best candidates - Powered by 1.8B+ professional relationships**")
     
     # Initialize demo
-    demo = NuvelProfessionalSimilarityDemo()
+    demo = get_demo()
+    
+    # Every cache is derived from the data file, so rebuild them all when it changes on disk
+    if demo.is_stale():
+        st.cache_data.clear()
+        st.cache_resource.clear()
+        demo = get_demo()
     
     if demo.df.empty:
+        # Don't keep serving a failed load once the data file is fixed: drop the cached
+        # (empty) frame as well as the instance, so the next run reads the file again
+        load_demo_data.clear()
+        get_demo.clear()
         st.error("Unable to load demo data. Please ensure the CSV file is available.")
         return
     
@@ -171,106 +493,10 @@ def main():
     tab1, tab2, tab3 = st.tabs(["🔍 Similarity Search", "⭐ Featured Professionals", "📊 Demo Insights"])
     
     with tab1:
-        st.header("🔍 Professional Similarity Search")
-        st.markdown("**Find professionals similar to your target candidates:**")
-        
-        col1, col2 = st.columns([3, 1])
-        with col1:
-            search_query = st.text_input(
-                "Search for professionals:",
-                placeholder="software engineer google, product manager meta, director amazon",
-                help="Search by name, title, company, or location"
-            )
-        with col2:
-            max_results = st.selectbox("Results:", [10, 15, 20], index=1)
-        
-        if st.button("🔍 Find Similar Professionals", type="primary") or search_query:
-            if search_query:
-                with st.spinner("Analyzing professional similarity patterns..."):
-                    results = demo.search_similar_professionals(search_query, max_results)
-                
-                if results:
-                    st.success(f"✅ Found **{len(results)}** similar professionals matching '{search_query}'")
-                    
-                    for i, result in enumerate(results, 1):
-                        with st.container():
-                            col1, col2 = st.columns([4, 1])
-                            
-                            with col1:
-                                st.markdown(f"### {i}. 👤 {result['name']}")
-                                st.markdown(f"**{result['title']}** at **{result['company']}**")
-                                st.markdown(f"📍 {result['location']}")
-                                st.caption(result['source_reference'])
-                            
-                            with col2:
-                                st.metric("Similarity", f"{result['similarity_score']:.1f}%")
-                                if st.button("📧 Contact", key=f"contact_{i}", help="Full contact info in premium version"):
-                                    st.info("Contact information available in full platform")
-                            
-                            st.divider()
-                
-                else:
-                    st.warning("No similar professionals found for this search.")
-                    st.info("💡 Try: 'software engineer', 'google', 'product manager', 'director'")
-        
-        # Quick demo searches
-        st.markdown("### 🚀 Try These Demo Searches")
-        demo_searches = [
-            "software engineer google",
-            "product manager", 
-            "goldman sachs",
-            "director amazon",
-            "data scientist"
-        ]
-        
-        cols = st.columns(len(demo_searches))
-        for i, search_term in enumerate(demo_searches):
-            with cols[i]:
-                if st.button(f"🔍 {search_term.title()}", key=f"demo_{i}"):
-                    results = demo.search_similar_professionals(search_term, 5)
-                    if results:
-                        st.success(f"**{len(results)}** matches:")
-                        for j, r in enumerate(results[:3], 1):
-                            st.write(f"**{j}.** {r['name']} - *{r['title']}* @ **{r['company']}** ({r['similarity_score']:.1f}%)")
+        render_search_tab(demo)
     
     with tab2:
-        st.header("⭐ Featured Professional Networks")
-        st.markdown("**Explore these professionals and their similarity networks:**")
-        
-        featured = demo.get_featured_professionals(8)
-        
-        if featured:
-            for i, professional in enumerate(featured, 1):
-                with st.container():
-                    col1, col2, col3 = st.columns([3, 2, 1])
-                    
-                    with col1:
-                        st.markdown(f"### {i}. 👤 {professional['name']}")
-                        st.markdown(f"**{professional['title']}**")
-                        st.markdown(f"🏢 {professional['company']}")
-                        st.markdown(f"📍 {professional['location']}")
-                    
-                    with col2:
-                        st.metric("Similar Professionals", professional['network_size'])
-                        st.caption("In their similarity network")
-                    
-                    with col3:
-                        if st.button(f"👥 View Network", key=f"network_{i}", type="secondary"):
-                            similar_pros = demo.find_similar_to_professional(professional['name'])
-                            
-                            if similar_pros:
-                                st.success(f"**{len(similar_pros)}** professionals in {professional['name']}'s network:")
-                                
-                                for j, similar in enumerate(similar_pros[:6], 1):
-                                    with st.expander(f"#{j} {similar['name']} - {similar['company']}", expanded=True):
-                                        col_a, col_b = st.columns(2)
-                                        with col_a:
-                                            st.markdown(f"**{similar['title']}**")
-                                            st.markdown(f"📍 {similar['location']}")
-                                        with col_b:
-                                            st.metric("Similarity", f"{similar['similarity_score']:.1f}%")
-                    
-                    st.divider()
+        render_featured_tab(demo)
     
     with tab3:
         st.header("📊 Demo Intelligence Insights")